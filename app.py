@@ -1,19 +1,33 @@
-# app.py - PURE PYTHON RESUME ANALYZER (Render Compatible)
+# app.py - RESUME ANALYZER (Render Compatible)
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 import os
-import tempfile
+import asyncio
 import re
 import json
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from io import BytesIO
 from datetime import datetime
-import traceback
+import logging
+
+# Only warnings and errors are logged by default; set LOG_LEVEL=DEBUG to
+# trace each request.
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Enhanced Resume Analyzer API",
     description="API for analyzing resumes and extracting structured candidate information",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson serializes the nested analysis payload much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -31,17 +45,141 @@ class ResumeAnalysisResponse(BaseModel):
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF using pdfminer (pure Python)"""
+# Regular expressions used by the extractors, compiled once at import time
+# Contact details are found in one left-to-right scan; the named group that
+# matched tells which field it is. LinkedIn and GitHub come before the
+# generic URL branch so profile links are not taken as portfolio sites.
+_PERSONAL_INFO_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?:https?://)?(?:www\.)?(?P<linkedin>linkedin\.com/in/[^\s]+)'
+    r'|(?:https?://)?(?:www\.)?(?P<github>github\.com/[^\s]+)'
+    r'|(?P<portfolio>(?:https?://|www\.)[\w\-\.\~:/?#@!$&\'"\(\)\*\+,;=%]+)'
+    r'|(?P<phone>(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+)
+_NAME_RE = re.compile(r'^[A-Za-z\s\.\-]+$')
+_AT_SPLIT_RE = re.compile(r'\bat\b', re.IGNORECASE)
+_SEP_RE = re.compile(r'[|\-•,\u2013\u2014]')
+_DATE_RE = re.compile(r'(\d{4}\s*[-–]\s*\d{4}|\d{4}\s*[-–]\s*Present|Present|Current)')
+_DATE_TOKEN_RE = re.compile(r'(?:19|20)\d{2}|Present|Current')
+_YEAR_RE = re.compile(r'(19|20)\d{2}')
+_GPA_RE = re.compile(r'GPA\s*:?\s*(\d\.\d{1,2})', re.IGNORECASE)
+_BULLET_RE = re.compile(r'^[•\-]\s*')
+
+SKILL_CATEGORIES = {
+    "programming": [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust'
+    ],
+    "web": [
+        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 
+        'flask', 'spring', 'laravel', 'jquery', 'bootstrap'
+    ],
+    "data": [
+        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle',
+        'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'keras',
+        'tableau', 'power bi', 'data analysis', 'machine learning', 'deep learning'
+    ],
+    "devops": [
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab',
+        'terraform', 'ansible', 'ci/cd', 'linux', 'unix', 'bash'
+    ],
+    "tools": [
+        'git', 'github', 'gitlab', 'jira', 'confluence', 'docker', 'postman',
+        'visual studio', 'eclipse', 'intellij', 'pycharm'
+    ],
+    "soft_skills": [
+        'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
+        'project management', 'agile', 'scrum', 'time management', 'adaptability'
+    ]
+}
+
+# Plain-word skill keywords are matched by intersecting them with the
+# resume's tokens; keywords containing spaces or punctuation (e.g.
+# "machine learning", "node.js", "c++") are looked up with str.find.
+_WORD_RE = re.compile(r'\w+')
+_SKILL_KEYWORDS = dict.fromkeys(keyword for keywords in SKILL_CATEGORIES.values() for keyword in keywords)
+_SKILL_WORDS = frozenset(keyword for keyword in _SKILL_KEYWORDS if _WORD_RE.fullmatch(keyword))
+_SKILL_PHRASES = tuple(keyword for keyword in _SKILL_KEYWORDS if keyword not in _SKILL_WORDS)
+
+# Optional cap on pages parsed per upload, to guard against very long
+# documents. 0 (the default) parses every page.
+MAX_PDF_PAGES = int(os.environ.get("MAX_PDF_PAGES", 0))
+
+# OCR (Tesseract via PyMuPDF) only runs for pages without a text layer,
+# e.g. scanned resumes. Set OCR_FALLBACK=false to disable it. At most
+# OCR_MAX_PAGES pages are OCR'd per upload, rendered at OCR_DPI.
+OCR_FALLBACK = os.environ.get("OCR_FALLBACK", "true").lower() in ("1", "true", "yes")
+OCR_MAX_PAGES = int(os.environ.get("OCR_MAX_PAGES", 5))
+OCR_DPI = int(os.environ.get("OCR_DPI", 300))
+
+def _page_text(page, textpage=None) -> str:
+    """Return page text with a blank line between text blocks.
+
+    Like pdfminer's output, paragraphs are separated by empty lines; the
+    section scanner relies on them to end the summary and split projects.
+    """
+    blocks = page.get_text("blocks", sort=True, textpage=textpage)
+    # Block type 0 is text, 1 is an image
+    return "\n\n".join(block[4].strip("\n") for block in blocks if block[6] == 0)
+
+def _ocr_page_text(page) -> str:
+    """OCR a PDF page that has no extractable text"""
     try:
-        from pdfminer.high_level import extract_text
-        text = extract_text(file_path)
-        return text
+        textpage = page.get_textpage_ocr(full=True, dpi=OCR_DPI)
+        return _page_text(page, textpage)
     except Exception as e:
-        print(f"PDF text extraction error: {e}")
+        logger.warning("OCR fallback failed on page %d: %s", page.number + 1, e)
         return ""
 
-def extract_personal_info(text: str) -> Dict[str, str]:
+def iter_pdf_pages(content: bytes) -> Iterator[str]:
+    """Yield the text of each PDF page using PyMuPDF, falling back to pdfminer"""
+    try:
+        import fitz
+        doc = fitz.open(stream=content, filetype="pdf")
+    except Exception as e:
+        logger.warning("PyMuPDF extraction failed, falling back to pdfminer: %s", e)
+        doc = None
+
+    if doc is not None and doc.needs_pass:
+        # PyMuPDF cannot read pages of a password-protected document
+        logger.warning("PDF is password protected, falling back to pdfminer")
+        doc.close()
+        doc = None
+
+    if doc is not None:
+        try:
+            page_count = doc.page_count
+            if MAX_PDF_PAGES and page_count > MAX_PDF_PAGES:
+                logger.warning("PDF has %d pages, only the first %d are parsed (MAX_PDF_PAGES)",
+                               page_count, MAX_PDF_PAGES)
+                page_count = MAX_PDF_PAGES
+            ocr_pages = 0
+            for page_number in range(page_count):
+                try:
+                    page = doc.load_page(page_number)
+                    page_text = _page_text(page)
+                except Exception as e:
+                    logger.warning("PyMuPDF could not read page %d, skipping it: %s", page_number + 1, e)
+                    continue
+                if OCR_FALLBACK and not page_text.strip():
+                    if ocr_pages < OCR_MAX_PAGES:
+                        ocr_pages += 1
+                        page_text = _ocr_page_text(page)
+                    elif ocr_pages == OCR_MAX_PAGES:
+                        ocr_pages += 1
+                        logger.warning("OCR limit of %d pages reached, remaining pages without text are skipped (OCR_MAX_PAGES)",
+                                       OCR_MAX_PAGES)
+                yield page_text
+        finally:
+            doc.close()
+        return
+
+    try:
+        from pdfminer.high_level import extract_text
+        yield extract_text(BytesIO(content), maxpages=MAX_PDF_PAGES)
+    except Exception as e:
+        logger.error("PDF text extraction error: %r", e)
+
+def extract_personal_info(lines: List[str], text: str) -> Dict[str, str]:
     """Extract comprehensive personal information"""
     info = {
         "full_name": "",
@@ -56,14 +194,12 @@ def extract_personal_info(text: str) -> Dict[str, str]:
         "portfolio": ""
     }
     
-    lines = text.split('\n')
-    
     # Extract name (usually first meaningful line)
-    for i, line in enumerate(lines[:10]):
+    for line in lines[:10]:
         line_clean = line.strip()
         if (len(line_clean) > 2 and len(line_clean) < 50 and
             not any(word in line_clean.lower() for word in ['resume', 'cv', 'curriculum', 'vitae', 'phone', 'email', 'linkedin']) and
-            re.match(r'^[A-Za-z\s\.\-]+$', line_clean)):
+            _NAME_RE.match(line_clean)):
             info["full_name"] = line_clean
             name_parts = line_clean.split()
             if name_parts:
@@ -71,363 +207,314 @@ def extract_personal_info(text: str) -> Dict[str, str]:
                 info["last_name"] = name_parts[-1] if len(name_parts) > 1 else ""
             break
     
-    # Extract email
-    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-    if email_match:
-        info["email"] = email_match.group() 
-    
-    # Extract phone
-    phone_patterns = [
-        r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'
-    ]
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, text)
-        if phone_match:
-            info["phone"] = phone_match.group()
-            break
-    
-    # Extract LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/[^\s]+', text)
-    if linkedin_match:
-        info["linkedin"] = linkedin_match.group()
-    
-    # Extract GitHub
-    github_match = re.search(r'github\.com/[^\s]+', text)
-    if github_match:
-        info["github"] = github_match.group()
-    
-    # Extract portfolio
-    portfolio_match = re.search(r'((https?://|www\.)[\w\-\.\~:/?#@!$&\'"\(\)\*\+,;=%]+)', text)
-    if portfolio_match:
-        candidate = portfolio_match.group(1).strip()
-        if '@' not in candidate and 'linkedin' not in candidate and 'github' not in candidate:
-            info["portfolio"] = candidate
+    # Extract email, phone, LinkedIn, GitHub and portfolio; first match wins
+    for match in _PERSONAL_INFO_RE.finditer(text):
+        field = match.lastgroup
+        if info[field]:
+            continue
+        value = match.group(field)
+        if field == "portfolio" and ('@' in value or 'linkedin' in value or 'github' in value):
+            continue
+        info[field] = value
 
     return info
 
-def extract_summary(text: str) -> str:
-    """Extract professional summary/objective"""
-    summary = ""
-    lines = text.split('\n')
-    in_summary = False
-    
-    for line in lines:
-        line_clean = line.strip()
-        if any(keyword in line_clean.lower() for keyword in ['summary', 'objective', 'profile', 'about']):
-            in_summary = True
-            continue
-        elif in_summary:
-            if line_clean and len(line_clean) > 10:
-                if any(section in line_clean.lower() for section in ['experience', 'education', 'skills', 'projects']):
-                    break
-                summary += line_clean + " "
-            else:
-                if summary:
-                    break
-    
-    return summary.strip()
-
-def extract_work_experience(text: str) -> List[Dict[str, Any]]:
-    """Extract work experience with detailed information"""
-    experience = []
-    lines = text.split('\n')
-    current_job = {}
-    in_experience_section = False
-    
-    for i, line in enumerate(lines):
-        line_clean = line.strip()
-        if not line_clean:
-            continue
-        
-        if any(keyword in line_clean.lower() for keyword in ['experience', 'work experience', 'employment', 'work history']):
-            in_experience_section = True
-            continue
-            
-        if in_experience_section:
-            if any(section in line_clean.lower() for section in ['education', 'skills', 'projects', 'certifications']):
-                break
-            
-            if not current_job and len(line_clean) > 5:
-                # Try to extract company and position
-                if re.search(r'\bat\b', line_clean, re.IGNORECASE):
-                    parts_at = re.split(r'\bat\b', line_clean, flags=re.IGNORECASE)
-                    if len(parts_at) >= 2:
-                        title_part = parts_at[0].strip()
-                        company_part = parts_at[1].strip()
-                        current_job = {
-                            "company_name": company_part,
-                            "job_title": title_part,
-                            "start_date": "",
-                            "end_date": "",
-                            "duration": "",
-                            "responsibilities": []
-                        }
-                else:
-                    # Try other separators
-                    parts = re.split(r'[|\-•,\u2013\u2014]', line_clean)
-                    if len(parts) >= 2:
-                        company_guess = parts[0].strip()
-                        title_guess = parts[1].strip()
-                        current_job = {
-                            "company_name": company_guess,
-                            "job_title": title_guess,
-                            "start_date": "",
-                            "end_date": "",
-                            "duration": "",
-                            "responsibilities": []
-                        }
+# Section headers recognised by ResumeSectionScanner. Certifications,
+# languages and awards must open the line; other keywords may appear anywhere
+# in it. A line is matched against all of them in a single regex search.
+_SECTION_RE = re.compile(
+    r'^(certificat|language|award)'
+    r'|\b(work history|experience|employment|education|academic|qualification'
+    r'|projects|portfolio|skills|summary|objective|profile|about|honou?r)'
+)
+_SECTION_MAP = {
+    "certificat": "certifications",
+    "language": "languages",
+    "award": "awards",
+    "work history": "experience",
+    "experience": "experience",
+    "employment": "experience",
+    "education": "education",
+    "academic": "education",
+    "qualification": "education",
+    "projects": "projects",
+    "portfolio": "projects",
+    "skills": "skills",
+    "summary": "summary",
+    "objective": "summary",
+    "profile": "summary",
+    "about": "summary",
+    "honor": "awards",
+    "honour": "awards",
+}
+_MAX_HEADER_WORDS = 4
 
-                # Extract dates
-                date_match = re.search(r'(\d{4}\s*[-–]\s*\d{4}|\d{4}\s*[-–]\s*Present|Present|Current)', line_clean)
-                if date_match and current_job:
-                    date_str = date_match.group()
-                    dates = re.findall(r'(19|20)\d{2}|Present|Current', date_str)
-                    if len(dates) >= 1:
-                        current_job["start_date"] = dates[0] + "-01" if dates[0] not in ['Present', 'Current'] else ""
-                    if len(dates) >= 2:
-                        current_job["end_date"] = dates[1] + "-01" if dates[1] not in ['Present', 'Current'] else "Present"
-                    current_job["duration"] = date_str
-            
-            elif current_job:
-                # Collect responsibilities
-                if (line_clean.startswith('•') or line_clean.startswith('-') or 
-                    (len(line_clean) > 20 and not re.search(r'(19|20)\d{2}', line_clean))):
-                    responsibility = re.sub(r'^[•\-]\s*', '', line_clean)
-                    if len(responsibility) > 10:
-                        current_job["responsibilities"].append(responsibility)
+_DEGREE_KEYWORDS = ('bachelor', 'master', 'phd', 'associate', 'diploma', 'degree')
+_PROJECT_TECH_KEYWORDS = ('python', 'java', 'react', 'node', 'sql', 'mongodb', 'aws')
+_PROJECT_TECH_SET = frozenset(_PROJECT_TECH_KEYWORDS)
+_TOKEN_RE = re.compile(r'[a-z0-9+#]+')
+_BULLET_PREFIXES = ('•', '-')
 
-                # Save job if we hit next section
-                if (i + 1 < len(lines) and 
-                    any(section in lines[i + 1].lower() for section in ['education', 'skills'])):
-                    experience.append(current_job)
-                    current_job = {}
-    
-    if current_job:
-        experience.append(current_job)
-    
-    return experience
+@lru_cache(maxsize=4096)
+def _classify_line(low: str) -> Optional[str]:
+    """Return the section a header line opens, or None for content lines.
 
-def extract_education(text: str) -> List[Dict[str, str]]:
-    """Extract education information"""
-    education = []
-    lines = text.split('\n')
-    
-    current_edu = {}
-    in_education_section = False
-    
-    for i, line in enumerate(lines):
-        line_clean = line.strip()
-        if not line_clean:
-            continue
-            
-        if any(keyword in line_clean.lower() for keyword in ['education', 'academic', 'qualifications']):
-            in_education_section = True
-            continue
-            
-        if in_education_section:
-            if any(section in line_clean.lower() for section in ['experience', 'skills', 'projects', 'certifications']):
-                break
-
-            if not current_edu and len(line_clean) > 5:
-                if any(degree in line_clean.lower() for degree in ['bachelor', 'master', 'phd', 'associate', 'diploma', 'degree']):
-                    current_edu = {
-                        "degree": "",
-                        "major": "",
-                        "school_name": "",
-                        "start_date": "",
-                        "end_date": "",
-                        "gpa": ""
-                    }
-                    
-                    # Extract institution
-                    if 'university' in line_clean.lower() or 'college' in line_clean.lower():
-                        current_edu["school_name"] = line_clean
-                    else:
-                        current_edu["degree"] = line_clean
-                    
-                    # Extract year
-                    year_match = re.search(r'(19|20)\d{2}', line_clean)
-                    if year_match:
-                        current_edu["end_date"] = year_match.group() + "-01"
-                    
-                    # Extract GPA
-                    gpa_match = re.search(r'GPA\s*:?\s*(\d\.\d{1,2})', line_clean, re.IGNORECASE)
-                    if gpa_match:
-                        current_edu["gpa"] = gpa_match.group(1)
-            
-            elif current_edu:
-                if not current_edu["school_name"] and ('university' in line_clean.lower() or 'college' in line_clean.lower()):
-                    current_edu["school_name"] = line_clean
-                
-                # Save education entry
-                if (i + 1 < len(lines) and 
-                    any(section in lines[i + 1].lower() for section in ['experience', 'skills', 'projects'])):
-                    education.append(current_edu)
-                    current_edu = {}
-    
-    if current_edu:
-        education.append(current_edu)
-    
-    return education
+    Cached because header lines such as "experience" or "education" repeat
+    verbatim across resumes.
+    """
+    if len(low.split()) > _MAX_HEADER_WORDS:
+        return None
+    m = _SECTION_RE.search(low)
+    return _SECTION_MAP[m.group(m.lastindex)] if m else None
 
-def extract_skills(text: str) -> Dict[str, List[str]]:
-    """Extract and categorize skills using pure Python"""
-    skills = {
-        "programming": [],
-        "web": [],
-        "data": [],
-        "devops": [],
-        "tools": [],
-        "soft_skills": []
-    }
-    
-    skill_categories = {
-        "programming": [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust'
-        ],
-        "web": [
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 
-            'flask', 'spring', 'laravel', 'jquery', 'bootstrap'
-        ],
-        "data": [
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle',
-            'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'keras',
-            'tableau', 'power bi', 'data analysis', 'machine learning', 'deep learning'
-        ],
-        "devops": [
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab',
-            'terraform', 'ansible', 'ci/cd', 'linux', 'unix', 'bash'
-        ],
-        "tools": [
-            'git', 'github', 'gitlab', 'jira', 'confluence', 'docker', 'postman',
-            'visual studio', 'eclipse', 'intellij', 'pycharm'
-        ],
-        "soft_skills": [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
-            'project management', 'agile', 'scrum', 'time management', 'adaptability'
-        ]
+def _start_job(line_clean: str, low: str) -> Dict[str, Any]:
+    """Parse a job header line into a work experience entry"""
+    job = {}
+    # "Title at Company"; the surrounding spaces keep words like "Atlassian" out.
+    # lower() can change the length of a string (e.g. 'İ'), in which case an
+    # index into low does not line up with line_clean; use the regex split then.
+    if len(low) == len(line_clean):
+        at_index = low.find(' at ')
+        parts_at = [line_clean[:at_index], line_clean[at_index + 4:]] if at_index > 0 else []
+    else:
+        parts_at = _AT_SPLIT_RE.split(line_clean, maxsplit=1)
+    if len(parts_at) == 2:
+        job = {
+            "company_name": parts_at[1].strip(),
+            "job_title": parts_at[0].strip(),
+            "start_date": "",
+            "end_date": "",
+            "duration": "",
+            "responsibilities": []
+        }
+    else:
+        # Try other separators
+        parts = _SEP_RE.split(line_clean)
+        if len(parts) >= 2:
+            job = {
+                "company_name": parts[0].strip(),
+                "job_title": parts[1].strip(),
+                "start_date": "",
+                "end_date": "",
+                "duration": "",
+                "responsibilities": []
+            }
+
+    # Extract dates
+    date_match = _DATE_RE.search(line_clean)
+    if date_match and job:
+        date_str = date_match.group()
+        dates = _DATE_TOKEN_RE.findall(date_str)
+        if len(dates) >= 1:
+            job["start_date"] = dates[0] + "-01" if dates[0] not in ['Present', 'Current'] else ""
+        if len(dates) >= 2:
+            job["end_date"] = dates[1] + "-01" if dates[1] not in ['Present', 'Current'] else "Present"
+        job["duration"] = date_str
+    return job
+
+def _start_education(line_clean: str, low: str) -> Dict[str, str]:
+    """Parse a degree line into an education entry"""
+    edu = {
+        "degree": "",
+        "major": "",
+        "school_name": "",
+        "start_date": "",
+        "end_date": "",
+        "gpa": ""
     }
-    
-    text_lower = text.lower()
-    
-    for category, keywords in skill_categories.items():
-        for keyword in keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                normalized_name = keyword.title()
-                if normalized_name not in skills[category]:
-                    skills[category].append(normalized_name)
-    
-    return skills
 
-def extract_projects(text: str) -> List[Dict[str, Any]]:
-    """Extract project information"""
-    projects = []
-    lines = text.split('\n')
-    
-    current_project = {}
-    in_project_section = False
-    
-    for i, line in enumerate(lines):
-        line_clean = line.strip()
-        if not line_clean:
-            continue
-            
-        # Detect projects section
-        if any(keyword in line_clean.lower() for keyword in ['projects', 'personal projects', 'portfolio']):
-            in_project_section = True
-            continue
-            
-        if in_project_section:
-            # Check if we're entering a new section
-            if any(section in line_clean.lower() for section in ['experience', 'education', 'skills', 'certifications']):
-                break
-        
-            if not current_project and len(line_clean) > 5 and len(line_clean) < 100:
-                current_project = {
-                    "title": line_clean,
-                    "description": "",
-                    "technologies": [],
-                    "role": "",
-                    "duration": ""
-                }
-            
-            elif current_project:
-                # Collect description and technologies
-                if len(line_clean) > 20:
+    # Extract institution
+    if 'university' in low or 'college' in low:
+        edu["school_name"] = line_clean
+    else:
+        edu["degree"] = line_clean
+
+    # Extract year
+    year_match = _YEAR_RE.search(line_clean)
+    if year_match:
+        edu["end_date"] = year_match.group() + "-01"
+
+    # Extract GPA
+    gpa_match = _GPA_RE.search(line_clean)
+    if gpa_match:
+        edu["gpa"] = gpa_match.group(1)
+    return edu
+
+class ResumeSectionScanner:
+    """Incremental single-pass scanner for line-based resume sections.
+
+    Lines can be fed page by page as they come out of the PDF; the section
+    state carries over between calls. Call finish() once to get the result.
+    """
+
+    def __init__(self):
+        self.result = {
+            "summary": "",
+            "work_experience": [],
+            "education": [],
+            "projects": [],
+            "certifications": [],
+            "languages": [],
+            "awards": []
+        }
+        self.summary_parts = []
+        self.section = None
+        self.current_job = {}
+        self.current_edu = {}
+        self.current_project = {}
+
+    def _close_entries(self) -> None:
+        if self.current_job:
+            self.result["work_experience"].append(self.current_job)
+            self.current_job = {}
+        if self.current_edu:
+            self.result["education"].append(self.current_edu)
+            self.current_edu = {}
+        if self.current_project:
+            self.result["projects"].append(self.current_project)
+            self.current_project = {}
+
+    def feed(self, lines: List[str]) -> None:
+        """Scan another chunk of resume lines"""
+        result = self.result
+        # Bind module-level helpers to locals once; this loop runs for every line
+        classify_line = _classify_line
+        year_search = _YEAR_RE.search
+        strip_bullet = _BULLET_RE.sub
+        find_tokens = _TOKEN_RE.findall
+
+        for line in lines:
+            line_clean = line.strip()
+            section = self.section
+
+            if not line_clean:
+                # A blank line closes the summary, and the current project once
+                # its description has been read (a title may be followed by a gap)
+                if section == "summary" and self.summary_parts:
+                    self.section = None
+                elif self.current_project.get("description"):
+                    result["projects"].append(self.current_project)
+                    self.current_project = {}
+                continue
+
+            # Lowercase each line once; every check below reuses it
+            low = line_clean.lower()
+            header = classify_line(low)
+            if header:
+                self._close_entries()
+                self.section = header
+                continue
+
+            if section == "summary":
+                # A short non-header line also ends the summary
+                if len(line_clean) > 10:
+                    self.summary_parts.append(line_clean)
+                elif self.summary_parts:
+                    self.section = None
+
+            elif section == "experience":
+                current_job = self.current_job
+                if not current_job:
+                    if len(line_clean) > 5:
+                        self.current_job = _start_job(line_clean, low)
+                elif (line_clean.startswith(_BULLET_PREFIXES) or
+                      (len(line_clean) > 20 and not year_search(line_clean))):
+                    # Collect responsibilities
+                    responsibility = strip_bullet('', line_clean)
+                    if len(responsibility) > 10:
+                        current_job["responsibilities"].append(responsibility)
+
+            elif section == "education":
+                current_edu = self.current_edu
+                if not current_edu:
+                    if len(line_clean) > 5 and any(degree in low for degree in _DEGREE_KEYWORDS):
+                        self.current_edu = _start_education(line_clean, low)
+                elif not current_edu["school_name"] and ('university' in low or 'college' in low):
+                    current_edu["school_name"] = line_clean
+
+            elif section == "projects":
+                current_project = self.current_project
+                if not current_project:
+                    if 5 < len(line_clean) < 100:
+                        self.current_project = {
+                            "title": line_clean,
+                            "description": "",
+                            "technologies": [],
+                            "role": "",
+                            "duration": ""
+                        }
+                elif len(line_clean) > 20:
+                    # Collect description and technologies
                     if not current_project["description"]:
                         current_project["description"] = line_clean
                     else:
-                        # Extract technologies from description
-                        tech_keywords = ['python', 'java', 'react', 'node', 'sql', 'mongodb', 'aws']
-                        found_tech = [tech for tech in tech_keywords if tech in line_clean.lower()]
-                        for tech in found_tech:
-                            if tech.title() not in current_project["technologies"]:
+                        found_tech = _PROJECT_TECH_SET.intersection(find_tokens(low))
+                        for tech in _PROJECT_TECH_KEYWORDS:
+                            if tech in found_tech and tech.title() not in current_project["technologies"]:
                                 current_project["technologies"].append(tech.title())
-                
-                # Save project
-                if (i + 1 < len(lines) and 
-                    (len(lines[i + 1].strip()) == 0 or 
-                     any(section in lines[i + 1].lower() for section in ['experience', 'education']))):
-                    projects.append(current_project)
-                    current_project = {}
-    
-    if current_project:
-        projects.append(current_project)
-    
-    return projects
 
-def extract_additional_info(text: str) -> Dict[str, Any]:
-    """Extract certifications, languages, awards"""
-    info = {
-        "certifications": [],
-        "languages": [],
-        "awards": []
-    }
-    
-    lines = text.split('\n')
-    current_section = ""
+            elif section in ("certifications", "languages", "awards"):
+                if len(line_clean) > 2:
+                    result[section].append(line_clean)
+
+    def finish(self) -> Dict[str, Any]:
+        """Close any open entries and return the extracted sections"""
+        self._close_entries()
+        self.result["summary"] = " ".join(self.summary_parts)
+        return self.result
+
+def _is_word_char(text: str, pos: int) -> bool:
+    return 0 <= pos < len(text) and (text[pos].isalnum() or text[pos] == '_')
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Same semantics as regex \\b at position pos"""
+    return _is_word_char(text, pos - 1) != _is_word_char(text, pos)
+
+def _contains_phrase(text_lower: str, phrase: str) -> bool:
+    """True if phrase occurs in text_lower with word boundaries on both sides"""
+    start = text_lower.find(phrase)
+    while start != -1:
+        if _is_word_boundary(text_lower, start) and _is_word_boundary(text_lower, start + len(phrase)):
+            return True
+        start = text_lower.find(phrase, start + 1)
+    return False
+
+def extract_skills(text: str) -> Dict[str, List[str]]:
+    """Extract and categorize skills with one tokenization and set lookups"""
+    text_lower = text.lower()
+    found = _SKILL_WORDS.intersection(_WORD_RE.findall(text_lower)).union(
+        phrase for phrase in _SKILL_PHRASES if _contains_phrase(text_lower, phrase)
+    )
     
-    for line in lines:
-        line_clean = line.strip()
-        if not line_clean:
-            continue
-            
-        # Detect sections
-        low = line_clean.lower()
-        if low.startswith('certificat') or low.startswith('certification'):
-            current_section = "certifications"
-            continue
-        elif low.startswith('language') or low == 'languages' or low.startswith('languages:'):
-            current_section = "languages"
+    # Report skills in keyword-table order so responses are deterministic
+    return {
+        category: [keyword.title() for keyword in keywords if keyword in found]
+        for category, keywords in SKILL_CATEGORIES.items()
+    }
+
+def _job_date_spans(work_experience: List[Dict]) -> List[tuple]:
+    """Parse job dates once into (start_year, start_month, end_year, end_month)"""
+    now = datetime.now()
+    spans = []
+    for job in work_experience:
+        start_date = job.get("start_date")
+        end_date = job.get("end_date")
+        if not (start_date and end_date):
             continue
-        elif low.startswith('award') or low.startswith('awards') or 'honor' in low:
-            current_section = "awards"
+        try:
+            start_year, start_month = map(int, start_date.split('-'))
+            if end_date == "Present":
+                end_year, end_month = now.year, now.month
+            else:
+                end_year, end_month = map(int, end_date.split('-'))
+        except ValueError:
             continue
-            
-        # Add items to current section
-        if current_section and len(line_clean) > 2:
-            if current_section == "certifications":
-                info["certifications"].append(line_clean)
-            elif current_section == "languages":
-                info["languages"].append(line_clean)
-            elif current_section == "awards":
-                info["awards"].append(line_clean)
-    
-    return info
+        spans.append((start_year, start_month, end_year, end_month))
+    return spans
 
 def calculate_experience_level(work_experience: List[Dict], text: str) -> str:
     """Determine candidate experience level"""
-    total_years = 0
-
-    for job in work_experience:
-        if job.get("start_date") and job.get("end_date"):
-            try:
-                start_year = int(job["start_date"][:4]) if job["start_date"] else 0
-                end_year = int(job["end_date"][:4]) if job["end_date"] != "Present" else datetime.now().year
-                total_years += (end_year - start_year)
-            except:
-                pass
+    total_years = sum(end_year - start_year for start_year, _, end_year, _ in _job_date_spans(work_experience))
 
     if total_years == 0:
         if len(text) > 3000:
@@ -446,23 +533,10 @@ def calculate_experience_level(work_experience: List[Dict], text: str) -> str:
 
 def calculate_total_experience(work_experience: List[Dict]) -> str:
     """Calculate total experience in years"""
-    total_months = 0
-    
-    for job in work_experience:
-        if job.get("start_date") and job.get("end_date"):
-            try:
-                start_date = job["start_date"]
-                end_date = job["end_date"]
-                
-                if end_date == "Present":
-                    end_date = datetime.now().strftime("%Y-%m")
-                
-                start_year, start_month = map(int, start_date.split('-'))
-                end_year, end_month = map(int, end_date.split('-'))
-                
-                total_months += (end_year - start_year) * 12 + (end_month - start_month)
-            except:
-                continue
+    total_months = sum(
+        (end_year - start_year) * 12 + (end_month - start_month)
+        for start_year, start_month, end_year, end_month in _job_date_spans(work_experience)
+    )
     
     years = total_months // 12
     months = total_months % 12
@@ -474,65 +548,164 @@ def calculate_total_experience(work_experience: List[Dict]) -> str:
     else:
         return f"{years} years {months} months"
 
+# Analysis results keyed by SHA-256 of the uploaded PDF and the extraction
+# settings. Kept in process by default; set REDIS_URL (and install the
+# optional redis package) to share the cache between workers.
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", 256))
+RESULT_CACHE_TTL = int(os.environ.get("RESULT_CACHE_TTL", 86400))
+# After a Redis error the in-process cache is used for this many seconds
+REDIS_RETRY_SECONDS = 30
+_result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+_redis_client = None
+_redis_unavailable = False
+_redis_retry_at = 0.0
+
+def _get_redis():
+    """Return a Redis client when REDIS_URL is configured and reachable, else None"""
+    global _redis_client, _redis_unavailable
+    redis_url = os.environ.get("REDIS_URL")
+    if not redis_url or _redis_unavailable or time.monotonic() < _redis_retry_at:
+        return None
+    if _redis_client is None:
+        try:
+            import redis
+            # Short timeouts so an unreachable server can't stall worker threads
+            _redis_client = redis.Redis.from_url(redis_url, socket_connect_timeout=1, socket_timeout=1)
+        except Exception as e:
+            # Don't retry on every request; fall back to the in-process cache
+            logger.warning("Redis cache unavailable, using in-process cache: %s", e)
+            _redis_unavailable = True
+            return None
+    return _redis_client
+
+def _redis_failed(e: Exception) -> None:
+    """Use the in-process cache for a while after a Redis error"""
+    global _redis_retry_at
+    logger.warning("Redis cache error, using in-process cache for %ds: %s", REDIS_RETRY_SECONDS, e)
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+
+def _result_cache_key(content: bytes) -> str:
+    """Cache key covering the PDF bytes and the settings that change extraction"""
+    digest = hashlib.sha256(content).hexdigest()
+    return f"{digest}:pages={MAX_PDF_PAGES}:ocr={int(OCR_FALLBACK)}"
+
+def get_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    """Look up a previous analysis of the same PDF bytes"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            cached = client.get(f"resume:{key}")
+            return json.loads(cached) if cached else None
+        except Exception as e:
+            _redis_failed(e)
+
+    with _result_cache_lock:
+        data = _result_cache.get(key)
+        if data is not None:
+            _result_cache.move_to_end(key)
+        return data
+
+def set_cached_result(key: str, data: Dict[str, Any]) -> None:
+    """Store an analysis result, evicting the least recently used entry"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.set(f"resume:{key}", json.dumps(data), ex=RESULT_CACHE_TTL)
+            return
+        except Exception as e:
+            _redis_failed(e)
+
+    if RESULT_CACHE_SIZE <= 0:
+        return
+    with _result_cache_lock:
+        _result_cache[key] = data
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+def analyze_resume_text(lines: List[str], resume_text: str, sections: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the structured resume data from extracted PDF text, its lines and scanned sections"""
+    personal_info = extract_personal_info(lines, resume_text)
+    skills = extract_skills(resume_text)
+    work_experience = sections["work_experience"]
+
+    # Calculate experience metrics
+    experience_level = calculate_experience_level(work_experience, resume_text)
+    total_experience = calculate_total_experience(work_experience)
+    
+    # Build comprehensive JSON response
+    return {
+        "personal_info": personal_info,
+        "summary": sections["summary"],
+        "work_experience": work_experience,
+        "education": sections["education"],
+        "skills": skills,
+        "projects": sections["projects"],
+        "certifications": sections["certifications"],
+        "languages": sections["languages"],
+        "awards": sections["awards"],
+        "total_experience": total_experience,
+        "experience_level": experience_level
+    }
+
+def _sync_analyze(content: bytes) -> Dict[str, Any]:
+    """Analyze PDF bytes, reusing a cached result for identical uploads"""
+    key = _result_cache_key(content)
+    cached = get_cached_result(key)
+    if cached is not None:
+        logger.debug("Returning cached analysis for %s", key[:12])
+    else:
+        cached = _analyze_pdf(content)
+        set_cached_result(key, cached)
+
+    # The analysis date is added per request so cached results never show a stale one
+    return dict(
+        cached["data"],
+        additional_info=f"Analyzed on {datetime.now().strftime('%Y-%m-%d')}. Text length: {cached['text_length']} characters."
+    )
+
+def _analyze_pdf(content: bytes) -> Dict[str, Any]:
+    """Extract and analyze PDF bytes; returns the cacheable result"""
+    # Extract text page by page, scanning sections as each page arrives
+    logger.debug("Extracting text from PDF")
+    # Each page is split into lines exactly once and shared by every extractor
+    scanner = ResumeSectionScanner()
+    pages = []
+    lines = []
+    for page_text in iter_pdf_pages(content):
+        page_lines = page_text.splitlines()
+        scanner.feed(page_lines)
+        lines.extend(page_lines)
+        pages.append(page_text)
+    resume_text = "\n".join(pages)
+    
+    if not resume_text or len(resume_text.strip()) < 50:
+        raise HTTPException(status_code=400, detail="Could not extract meaningful text from PDF")
+    
+    logger.debug("Extracted %d characters", len(resume_text))
+    
+    # Extract all structured information
+    logger.debug("Extracting structured information")
+    structured_data = analyze_resume_text(lines, resume_text, scanner.finish())
+    return {"data": structured_data, "text_length": len(resume_text)}
+
 @app.post("/analyze-resume", response_model=ResumeAnalysisResponse)
 async def analyze_resume(file: UploadFile = File(...)):
     """
     Analyze uploaded resume and return structured JSON data
     """
-    temp_path = None
     try:
-        print(f"🔍 Starting comprehensive analysis for: {file.filename}")
+        logger.debug("Starting comprehensive analysis for: %s", file.filename)
         
         if not file.filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are allowed")
         
-        # Save uploaded file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_path = temp_file.name
-        
-        # Extract text from PDF
-        print("📄 Extracting text from PDF...")
-        resume_text = extract_text_from_pdf(temp_path)
-        
-        if not resume_text or len(resume_text.strip()) < 50:
-            raise HTTPException(status_code=400, detail="Could not extract meaningful text from PDF")
-        
-        print(f"📝 Extracted {len(resume_text)} characters")
-        
-        # Extract all structured information
-        print("🔧 Extracting structured information...")
-        
-        personal_info = extract_personal_info(resume_text)
-        summary = extract_summary(resume_text)
-        work_experience = extract_work_experience(resume_text)
-        education = extract_education(resume_text)
-        skills = extract_skills(resume_text)
-        projects = extract_projects(resume_text)
-        additional_info = extract_additional_info(resume_text)
-
-        # Calculate experience metrics
-        experience_level = calculate_experience_level(work_experience, resume_text)
-        total_experience = calculate_total_experience(work_experience)
-        
-        # Build comprehensive JSON response
-        structured_data = {
-            "personal_info": personal_info,
-            "summary": summary,
-            "work_experience": work_experience,
-            "education": education,
-            "skills": skills,
-            "projects": projects,
-            "certifications": additional_info["certifications"],
-            "languages": additional_info["languages"],
-            "awards": additional_info["awards"],
-            "total_experience": total_experience,
-            "experience_level": experience_level,
-            "additional_info": f"Analyzed on {datetime.now().strftime('%Y-%m-%d')}. Text length: {len(resume_text)} characters."
-        }
+        content = await file.read()
+        # Parsing and extraction are CPU-bound; keep them off the event loop
+        structured_data = await asyncio.to_thread(_sync_analyze, content)
         
-        print("✅ Comprehensive analysis completed successfully")
+        logger.debug("Comprehensive analysis completed successfully")
         return ResumeAnalysisResponse(
             success=True,
             message="Resume analyzed successfully with structured data extraction",
@@ -542,19 +715,11 @@ async def analyze_resume(file: UploadFile = File(...)):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"💥 Unexpected error: {e}")
-        print(f"🔍 Stack trace: {traceback.format_exc()}")
+        logger.exception("Unexpected error while analyzing %s", file.filename)
         raise HTTPException(
             status_code=500, 
             detail=f"Analysis failed: {str(e)}"
         )
-    finally:
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.unlink(temp_path)
-                print(f"🧹 Cleaned: {temp_path}")
-            except:
-                pass
 
 @app.get("/")
 async def root():
@@ -562,7 +727,7 @@ async def root():
         "message": "Enhanced Resume Analyzer API", 
         "version": "2.0.0",
         "description": "Extracts structured JSON data from resumes",
-        "engine": "Pure Python (No Rust dependencies)",
+        "engine": "PyMuPDF text extraction with rule-based parsing",
         "endpoints": {
             "analyze_resume": "POST /analyze-resume",
             "health": "GET /health",
@@ -591,4 +756,6 @@ if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
     reload_flag = os.environ.get("DEV_RELOAD", "false").lower() in ("1", "true", "yes")
-    uvicorn.run(app, host="0.0.0.0", port=port, reload=reload_flag)
+    # Run one worker process per core; reload mode only supports a single process
+    workers = 1 if reload_flag else int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run("app:app", host="0.0.0.0", port=port, reload=reload_flag, workers=workers)